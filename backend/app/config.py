@@ -1,32 +1,26 @@
 """Application configuration utilities."""
 from __future__ import annotations
 
-from functools import lru_cache
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Runtime configuration sourced from environment variables."""
 
-    def __init__(self) -> None:
-        self.azure_openai_endpoint: Optional[str] = os.getenv("AZURE_OPENAI_ENDPOINT")
-        self.azure_openai_api_key: Optional[str] = os.getenv("AZURE_OPENAI_API_KEY")
-        self.azure_openai_deployment: Optional[str] = os.getenv("AZURE_OPENAI_DEPLOYMENT")
-        self.azure_openai_api_version: Optional[str] = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-01")
-        self.cors_allow_origins: list[str] = self._parse_list(os.getenv("CORS_ALLOW_ORIGINS"))
-
-    @staticmethod
-    def _parse_list(raw: Optional[str]) -> list[str]:
-        if not raw:
-            return ["*"]
-        return [item.strip() for item in raw.split(",") if item.strip()]
+    azure_openai_endpoint: Optional[str]
+    azure_openai_api_key: Optional[str]
+    azure_openai_deployment: Optional[str]
+    azure_openai_api_version: str
+    cors_allow_origins: tuple[str, ...]
+    _azure_config_validated: bool = field(default=False, repr=False)
 
     def require_azure_config(self) -> None:
+        if self._azure_config_validated:
+            return
         missing = [
             name
             for name, value in (
@@ -42,12 +36,32 @@ class Settings:
                 "Missing Azure OpenAI configuration. Please set the following environment variables: "
                 f"{joined}."
             )
+        object.__setattr__(self, "_azure_config_validated", True)
+
+
+def _parse_origins(raw: Optional[str]) -> tuple[str, ...]:
+    if not raw:
+        return ("*",)
+    return tuple(item.strip() for item in raw.split(",") if item.strip())
 
 
 @lru_cache
 def get_settings() -> Settings:
-    """Return cached settings instance."""
-    return Settings()
+    """Return cached settings loaded from the environment."""
+
+    # Production deployments provide the variables directly; only touch the
+    # .env file when key config is absent and loading is not explicitly skipped.
+    if os.getenv("SKIP_DOTENV") != "1" and not os.getenv("AZURE_OPENAI_API_KEY"):
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    return Settings(
+        azure_openai_endpoint=os.getenv("AZURE_OPENAI_ENDPOINT"),
+        azure_openai_api_key=os.getenv("AZURE_OPENAI_API_KEY"),
+        azure_openai_deployment=os.getenv("AZURE_OPENAI_DEPLOYMENT"),
+        azure_openai_api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-01"),
+        cors_allow_origins=_parse_origins(os.getenv("CORS_ALLOW_ORIGINS")),
+    )
 
 
 __all__ = ["Settings", "get_settings"]
@@ -1,15 +1,19 @@
 """FastAPI application entrypoint."""
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
 import logging
-from functools import lru_cache
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Annotated, cast
+from typing import Annotated, AsyncIterator
 
-from fastapi import Depends, FastAPI, File, Form, HTTPException, UploadFile
+import orjson
+from fastapi import Depends, FastAPI, File, Form, HTTPException, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 
 from .config import Settings, get_settings
 from .schemas import (
@@ -23,7 +27,7 @@ from .schemas import (
     SummaryResponse,
 )
 from .services.interview_service import InterviewService
-from .services.llm_client import AzureOpenAILLM
+from .services.llm_client import AzureOpenAILLM, SingleFlightLLM
 from .utils.prompt_templates import SKILL_RUBRIC
 
 LOGGER = logging.getLogger(__name__)
@@ -32,6 +36,7 @@ app = FastAPI(
     title="AI-Powered Excel Mock Interviewer",
     version="0.1.0",
     description="Enterprise-ready service for delivering consistent Excel interview experiences.",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -51,64 +56,112 @@ async def configure_logging() -> None:  # pragma: no cover - startup hook
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
 
-    file_handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=5)
+    file_handler = RotatingFileHandler(log_file, maxBytes=1_000_000, backupCount=5, delay=True)
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
 
+    # Keep handler I/O off the event loop: request-path log calls only enqueue
+    # records; a background listener thread owns the console and file writes.
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    app.state.log_listener = listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
     root_logger.handlers.clear()
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(QueueHandler(log_queue))
 
     LOGGER.info("Logging configured. Writing chatbot activity to %s", log_file)
 
 
-def get_service(settings: Annotated[Settings, Depends(get_settings)]) -> InterviewService:
-    settings.require_azure_config()
+@app.on_event("startup")
+async def initialize_service() -> None:  # pragma: no cover - startup hook
+    """Validate configuration once and bind the shared service instance."""
 
-    return _get_service_instance(
-        cast(str, settings.azure_openai_endpoint),
-        cast(str, settings.azure_openai_api_key),
-        cast(str, settings.azure_openai_deployment),
-        settings.azure_openai_api_version,
-    )
+    settings = get_settings()
+    app.state.settings = settings
+    try:
+        settings.require_azure_config()
+    except RuntimeError as exc:
+        LOGGER.warning("Azure OpenAI configuration incomplete: %s", exc)
+        app.state.service = None
+        return
+    app.state.service = _build_service(settings)
+    # Prewarm DNS + TLS to Azure off the critical path so the first session
+    # request does not pay connection setup.
+    asyncio.create_task(app.state.service.warmup())
+
+
+@app.on_event("shutdown")
+async def shutdown_service() -> None:  # pragma: no cover - shutdown hook
+    """Release pooled HTTP connections held by the service."""
+
+    service = getattr(app.state, "service", None)
+    if service is not None:
+        await service.aclose()
 
 
-@lru_cache
-def _get_service_instance(
-    endpoint: str, api_key: str, deployment: str, api_version: str
-) -> InterviewService:
-    """Return a cached InterviewService so sessions persist across requests."""
+def _build_service(settings: Settings) -> InterviewService:
+    """Construct the InterviewService shared by all requests."""
 
     llm = AzureOpenAILLM(
-        api_key=api_key,
-        endpoint=endpoint,
-        deployment=deployment,
-        api_version=api_version,
+        api_key=settings.azure_openai_api_key,
+        endpoint=settings.azure_openai_endpoint,
+        deployment=settings.azure_openai_deployment,
+        api_version=settings.azure_openai_api_version,
     )
-    LOGGER.info("Initialized InterviewService with deployment '%s'", deployment)
-    return InterviewService(llm)
+    LOGGER.info("Initialized InterviewService with deployment '%s'", settings.azure_openai_deployment)
+    return InterviewService(SingleFlightLLM(llm))
+
+
+def get_service(request: Request) -> InterviewService:
+    service = getattr(request.app.state, "service", None)
+    if service is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Azure OpenAI configuration is missing or incomplete.",
+        )
+    return service
 
 
-settings = get_settings()
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_allow_origins,
+    allow_origins=get_settings().cors_allow_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+# Static payloads rendered once so repeat callers can short-circuit on ETag.
+HEALTH_JSON = orjson.dumps({"status": "ok"})
+HEALTH_ETAG = f'"{hashlib.blake2b(HEALTH_JSON, digest_size=8).hexdigest()}"'
+RUBRIC_JSON = orjson.dumps({"skills": dict(SKILL_RUBRIC)})
+RUBRIC_ETAG = f'"{hashlib.blake2b(RUBRIC_JSON, digest_size=8).hexdigest()}"'
+
+
 @app.get("/api/health")
-async def health() -> dict[str, str]:
-    return {"status": "ok"}
+async def health(request: Request) -> Response:
+    if request.headers.get("if-none-match") == HEALTH_ETAG:
+        return Response(status_code=304)
+    return Response(
+        HEALTH_JSON,
+        media_type="application/json",
+        headers={"etag": HEALTH_ETAG, "cache-control": "public, max-age=30"},
+    )
 
 
 @app.get("/api/rubric")
-async def rubric() -> dict[str, dict[str, str]]:
-    return {"skills": SKILL_RUBRIC}
+async def rubric(request: Request) -> Response:
+    if request.headers.get("if-none-match") == RUBRIC_ETAG:
+        return Response(status_code=304)
+    return Response(
+        RUBRIC_JSON,
+        media_type="application/json",
+        headers={"etag": RUBRIC_ETAG, "cache-control": "public, max-age=86400, immutable"},
+    )
 
 
 @app.post("/api/session", response_model=SessionCreateResponse)
@@ -117,7 +170,7 @@ async def create_session(
     service: Annotated[InterviewService, Depends(get_service)],
 ) -> SessionCreateResponse:
     try:
-        return service.create_session(payload)
+        return await service.create_session(payload)
     except Exception as exc:  # pragma: no cover - network failure
         LOGGER.exception("Failed to create session")
         raise HTTPException(status_code=500, detail=str(exc)) from exc
@@ -130,7 +183,7 @@ async def chat(
     service: Annotated[InterviewService, Depends(get_service)],
 ) -> ChatResponse:
     try:
-        return service.chat(session_id, payload.message)
+        return await service.chat(session_id, payload.message)
     except KeyError:
         raise HTTPException(status_code=404, detail="Session not found")
     except Exception as exc:  # pragma: no cover - network failure
@@ -138,13 +191,39 @@ async def chat(
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@app.post("/api/session/{session_id}/chat/stream")
+async def chat_stream(
+    session_id: str,
+    payload: ChatRequest,
+    service: Annotated[InterviewService, Depends(get_service)],
+) -> StreamingResponse:
+    try:
+        events = await service.chat_stream(session_id, payload.message)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    async def sse() -> AsyncIterator[bytes]:
+        try:
+            async for event in events:
+                yield b"data: " + orjson.dumps(event) + b"\n\n"
+        except Exception as exc:  # pragma: no cover - network failure
+            LOGGER.exception("Failed while streaming chat response")
+            yield b"data: " + orjson.dumps({"type": "error", "detail": str(exc)}) + b"\n\n"
+
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @app.get("/api/session/{session_id}/summary", response_model=SummaryResponse)
 async def summary(
     session_id: str,
     service: Annotated[InterviewService, Depends(get_service)],
 ) -> SummaryResponse:
     try:
-        return service.summarize(session_id)
+        return await service.summarize(session_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Session not found")
     except Exception as exc:  # pragma: no cover - network failure
@@ -158,7 +237,7 @@ async def list_artifacts(
     service: Annotated[InterviewService, Depends(get_service)],
 ) -> ArtifactListResponse:
     try:
-        artifacts = service.list_artifacts(session_id)
+        artifacts = await service.list_artifacts(session_id)
         return ArtifactListResponse(artifacts=artifacts)
     except KeyError:
         raise HTTPException(status_code=404, detail="Session not found")
@@ -172,12 +251,11 @@ async def upload_artifact(
     description: str = Form(""),
 ) -> ArtifactUploadResponse:
     try:
-        data = await file.read()
-        artifact = service.store_file_artifact(
+        artifact = await service.store_file_artifact(
             session_id,
             filename=file.filename or "submission.xlsx",
             content_type=file.content_type,
-            data=data,
+            file=file,
             description=description,
         )
         return ArtifactUploadResponse(artifact=artifact)
@@ -197,7 +275,7 @@ async def link_artifact(
     service: Annotated[InterviewService, Depends(get_service)],
 ) -> ArtifactUploadResponse:
     try:
-        artifact = service.store_link_artifact(
+        artifact = await service.store_link_artifact(
             session_id,
             url=payload.url.strip(),
             description=payload.description,
@@ -211,26 +289,37 @@ async def link_artifact(
 
 @app.get("/api/session/{session_id}/artifacts/{artifact_id}")
 async def download_artifact(
+    request: Request,
     session_id: str,
     artifact_id: str,
     service: Annotated[InterviewService, Depends(get_service)],
 ):
     try:
-        artifact = service.get_artifact(session_id, artifact_id)
+        artifact = await service.get_artifact(session_id, artifact_id)
     except KeyError:
         raise HTTPException(status_code=404, detail="Artifact not found")
 
     if artifact.source != "file" or not artifact.storage_path:
         raise HTTPException(status_code=400, detail="Artifact is not available for download")
 
+    # Stat once: it doubles as the existence check and feeds FileResponse,
+    # which would otherwise repeat the syscall.
     path = Path(artifact.storage_path)
-    if not path.exists():
+    try:
+        stat_result = path.stat()
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Stored file could not be found")
 
+    etag = f'"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304)
+
     return FileResponse(
         path,
         media_type=artifact.content_type or "application/octet-stream",
         filename=artifact.filename or path.name,
+        stat_result=stat_result,
+        headers={"Cache-Control": "private, max-age=3600", "ETag": etag},
     )
 
 
@@ -90,6 +90,10 @@ class SubmissionArtifact(BaseModel):
     filename: Optional[str] = None
     content_type: Optional[str] = None
     size_bytes: Optional[int] = None
+    sha256: Optional[str] = Field(
+        default=None,
+        description="SHA-256 digest of the stored file contents, used for dedup and caching.",
+    )
     uploaded_at: datetime
     description: str = Field(default="", description="Additional context supplied with the artifact.")
     url: Optional[str] = Field(
@@ -1,13 +1,18 @@
 """Core interview orchestration logic."""
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from pathlib import Path
-from typing import Dict, List, Optional
-from uuid import uuid4
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiofiles
+import orjson
+from fastapi import UploadFile
+from pydantic_core import to_json
+from uuid_utils import uuid7
 
 from ..schemas import (
     CandidateProfile,
@@ -29,6 +34,7 @@ from ..utils.prompt_templates import (
     build_summary_prompt,
 )
 from .llm_client import AzureOpenAILLM, LLMClient
+from .session_store import InMemorySessionStore, SessionStore
 
 
 @dataclass
@@ -42,11 +48,20 @@ class InterviewSession:
     workbook_platform: WorkbookPlatform
     messages: List[Dict[str, str]] = field(default_factory=list)
     transcript: List[ChatTurn] = field(default_factory=list)
+    transcript_json_chunks: List[bytes] = field(default_factory=list)
     score_totals: Dict[str, float] = field(default_factory=dict)
     score_counts: Dict[str, int] = field(default_factory=dict)
     artifacts: Dict[str, SubmissionArtifact] = field(default_factory=dict)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    _running: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        # Seed every rubric skill once so running averages always cover the
+        # full rubric without per-turn setdefault churn.
+        for skill in SKILL_RUBRIC:
+            self.score_totals.setdefault(skill, 0.0)
+            self.score_counts.setdefault(skill, 0)
 
     def record_scores(self, scores: Dict[str, float]) -> Dict[str, float]:
         """Update running score averages based on a new evaluation."""
@@ -57,22 +72,74 @@ class InterviewSession:
                 continue
             self.score_totals[skill] = self.score_totals.get(skill, 0.0) + float(value)
             self.score_counts[skill] = self.score_counts.get(skill, 0) + 1
-            updated[skill] = self.score_totals[skill] / self.score_counts[skill]
+            average = self.score_totals[skill] / self.score_counts[skill]
+            self._running[skill] = average
+            updated[skill] = average
         return updated
 
     def running_scores(self) -> Dict[str, float]:
-        """Compute the current running averages for all tracked skills."""
+        """Return the current running averages for all scored skills."""
+
+        return self._running
+
+    def to_payload(self) -> Dict[str, object]:
+        """Serialize the session to a JSON-safe payload for external stores."""
 
         return {
-            skill: self.score_totals[skill] / self.score_counts[skill]
-            for skill in self.score_totals
-            if self.score_counts.get(skill)
+            "session_id": self.session_id,
+            "candidate": self.candidate.model_dump(mode="json"),
+            "scenario": self.scenario,
+            "focus_areas": [area.value for area in self.focus_areas],
+            "workbook_platform": self.workbook_platform.value,
+            "messages": self.messages,
+            "transcript": [turn.model_dump(mode="json") for turn in self.transcript],
+            "transcript_json_chunks": [chunk.decode() for chunk in self.transcript_json_chunks],
+            "score_totals": self.score_totals,
+            "score_counts": self.score_counts,
+            "artifacts": {
+                artifact_id: {
+                    **artifact.model_dump(mode="json"),
+                    # storage_path is excluded from API serialization but must
+                    # survive a store round-trip for downloads to keep working.
+                    "storage_path": artifact.storage_path,
+                }
+                for artifact_id, artifact in self.artifacts.items()
+            },
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "running": self._running,
         }
 
+    @classmethod
+    def from_payload(cls, payload: Dict[str, object]) -> "InterviewSession":
+        """Rebuild a session from a payload produced by to_payload."""
+
+        return cls(
+            session_id=payload["session_id"],
+            candidate=CandidateProfile.model_validate(payload["candidate"]),
+            scenario=payload["scenario"],
+            focus_areas=[FocusArea(area) for area in payload["focus_areas"]],
+            workbook_platform=WorkbookPlatform(payload["workbook_platform"]),
+            messages=list(payload["messages"]),
+            transcript=[ChatTurn.model_validate(turn) for turn in payload["transcript"]],
+            transcript_json_chunks=[chunk.encode() for chunk in payload["transcript_json_chunks"]],
+            score_totals=dict(payload["score_totals"]),
+            score_counts=dict(payload["score_counts"]),
+            artifacts={
+                artifact_id: SubmissionArtifact.model_validate(artifact)
+                for artifact_id, artifact in payload["artifacts"].items()
+            },
+            created_at=datetime.fromisoformat(payload["created_at"]),
+            updated_at=datetime.fromisoformat(payload["updated_at"]),
+            _running=dict(payload.get("running", {})),
+        )
+
 
 class InterviewService:
     """Coordinates LLM calls and aggregates interview analytics."""
 
+    UPLOAD_CHUNK_BYTES = 1 << 20
+
     ALLOWED_FILE_EXTENSIONS = {
         ".xlsx",
         ".xlsm",
@@ -87,23 +154,38 @@ class InterviewService:
         self,
         llm_client: LLMClient,
         *,
+        store: SessionStore | None = None,
         storage_dir: Path | None = None,
         max_upload_bytes: int = 10 * 1024 * 1024,
     ) -> None:
         self._llm_client = llm_client
-        self._sessions: Dict[str, InterviewSession] = {}
+        self._store = store or InMemorySessionStore()
         self._logger = logging.getLogger(self.__class__.__name__)
         self._storage_dir = storage_dir or Path(__file__).resolve().parent.parent.parent / "uploads"
         self._storage_dir.mkdir(parents=True, exist_ok=True)
         self._max_upload_bytes = max_upload_bytes
 
-    def create_session(self, payload: SessionCreateRequest) -> SessionCreateResponse:
+    async def aclose(self) -> None:
+        """Close resources held by the underlying LLM client, if any."""
+
+        aclose = getattr(self._llm_client, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def warmup(self) -> None:
+        """Prewarm the underlying LLM client's connection, if supported."""
+
+        warmup = getattr(self._llm_client, "warmup", None)
+        if warmup is not None:
+            await warmup()
+
+    async def create_session(self, payload: SessionCreateRequest) -> SessionCreateResponse:
         self._logger.info(
             "Creating interview session for candidate '%s' targeting '%s'",
             payload.candidate.name,
             payload.candidate.target_role,
         )
-        session_id = str(uuid4())
+        session_id = str(uuid7())
         session = InterviewSession(
             session_id=session_id,
             candidate=payload.candidate,
@@ -122,27 +204,33 @@ class InterviewService:
         session.messages.append({"role": "system", "content": system_prompt})
         session.messages.append({"role": "user", "content": bootstrap_prompt})
 
-        llm_payload = self._llm_client.chat_completion(session.messages)
-        content = AzureOpenAILLM.extract_content(llm_payload)
-        turn = self._record_ai_turn(session, content, candidate_message=None)
-        self._sessions[session_id] = session
+        llm_payload = await self._llm_client.chat_completion(session.messages)
+        content, raw_content = AzureOpenAILLM.extract_content(llm_payload)
+        turn = self._record_ai_turn(
+            session, content, raw_content, candidate_message=None, now=datetime.now(UTC)
+        )
+        await self._store.put(session)
 
         self._logger.info("Session %s created with %d focus areas", session_id, len(session.focus_areas))
         return SessionCreateResponse(session_id=session_id, first_turn=turn)
 
-    def chat(self, session_id: str, message: str) -> ChatResponse:
-        session = self._get_session(session_id)
+    async def chat(self, session_id: str, message: str) -> ChatResponse:
+        session = await self._get_session(session_id)
         self._logger.info(
             "Processing candidate reply for session %s (message length=%d)",
             session_id,
             len(message),
         )
-        candidate_msg = ChatMessage(role="candidate", content=message, created_at=datetime.utcnow())
+        now = datetime.now(UTC)
+        candidate_msg = ChatMessage.model_construct(role="candidate", content=message, created_at=now)
         session.messages.append({"role": "user", "content": message})
 
-        llm_payload = self._llm_client.chat_completion(session.messages)
-        content = AzureOpenAILLM.extract_content(llm_payload)
-        turn = self._record_ai_turn(session, content, candidate_message=candidate_msg)
+        llm_payload = await self._llm_client.chat_completion(session.messages)
+        content, raw_content = AzureOpenAILLM.extract_content(llm_payload)
+        turn = self._record_ai_turn(
+            session, content, raw_content, candidate_message=candidate_msg, now=datetime.now(UTC)
+        )
+        await self._store.put(session)
         running_scores = session.running_scores()
         self._logger.info(
             "Session %s processed. Transcript turns=%d, scores_tracked=%d",
@@ -152,25 +240,61 @@ class InterviewService:
         )
         return ChatResponse(turn=turn, running_scores=running_scores, total_turns=len(session.transcript))
 
-    def summarize(self, session_id: str) -> SummaryResponse:
-        session = self._get_session(session_id)
+    async def chat_stream(self, session_id: str, message: str) -> AsyncIterator[Dict[str, object]]:
+        """Stream a candidate reply: interviewer deltas first, then the recorded turn.
+
+        The session is resolved eagerly so unknown ids raise KeyError before
+        any response bytes are produced.
+        """
+
+        session = await self._get_session(session_id)
+        return self._stream_turn(session, message)
+
+    async def _stream_turn(
+        self, session: InterviewSession, message: str
+    ) -> AsyncIterator[Dict[str, object]]:
+        candidate_msg = ChatMessage.model_construct(
+            role="candidate", content=message, created_at=datetime.now(UTC)
+        )
+        session.messages.append({"role": "user", "content": message})
+
+        pieces: List[str] = []
+        async for delta in self._llm_client.chat_completion_stream(session.messages):
+            if delta:
+                pieces.append(delta)
+                yield {"type": "delta", "content": delta}
+
+        raw_content = "".join(pieces)
+        try:
+            content = orjson.loads(raw_content)
+        except orjson.JSONDecodeError as exc:
+            raise ValueError("Unable to parse streamed LLM response payload") from exc
+        turn = self._record_ai_turn(
+            session, content, raw_content, candidate_message=candidate_msg, now=datetime.now(UTC)
+        )
+        await self._store.put(session)
+        response = ChatResponse(
+            turn=turn,
+            running_scores=session.running_scores(),
+            total_turns=len(session.transcript),
+        )
+        yield {"type": "turn", "data": response.model_dump(mode="json")}
+
+    async def summarize(self, session_id: str) -> SummaryResponse:
+        session = await self._get_session(session_id)
         self._logger.info("Generating summary for session %s", session_id)
-        transcript_payload = [
-            {
-                "candidate_message": turn.candidate_message.model_dump() if turn.candidate_message else None,
-                "interviewer_message": turn.interviewer_message.model_dump(),
-                "evaluation": turn.evaluation.model_dump() if turn.evaluation else None,
-                "next_best_action": turn.next_best_action,
-            }
-            for turn in session.transcript
-        ]
         summary_prompt = build_summary_prompt(
             session.candidate,
-            json.dumps(transcript_payload, default=str),
+            (b"[" + b",".join(session.transcript_json_chunks) + b"]").decode(),
         )
-        messages = session.messages + [{"role": "user", "content": summary_prompt}]
-        llm_payload = self._llm_client.chat_completion(messages)
-        content = AzureOpenAILLM.extract_content(llm_payload)
+        # Append the summary prompt in place instead of copying the message log,
+        # and pop it afterwards so the session history stays untouched.
+        session.messages.append({"role": "user", "content": summary_prompt})
+        try:
+            llm_payload = await self._llm_client.chat_completion(session.messages)
+        finally:
+            session.messages.pop()
+        content, _ = AzureOpenAILLM.extract_content(llm_payload)
 
         overall_summary = content.get("overall_summary", "")
         scorecard = content.get("scorecard", {})
@@ -190,85 +314,123 @@ class InterviewService:
         )
         return response
 
-    def list_artifacts(self, session_id: str) -> List[SubmissionArtifact]:
-        session = self._get_session(session_id)
-        return sorted(session.artifacts.values(), key=lambda artifact: artifact.uploaded_at, reverse=True)
+    async def list_artifacts(self, session_id: str) -> List[SubmissionArtifact]:
+        session = await self._get_session(session_id)
+        # Artifact ids are time-ordered UUIDv7s, so insertion order already
+        # matches upload time; newest first is just the reversed dict view.
+        return list(reversed(session.artifacts.values()))
 
-    def store_file_artifact(
+    async def store_file_artifact(
         self,
         session_id: str,
         *,
         filename: str,
         content_type: Optional[str],
-        data: bytes,
+        file: UploadFile,
         description: str | None = None,
     ) -> SubmissionArtifact:
-        session = self._get_session(session_id)
+        session = await self._get_session(session_id)
         extension = Path(filename).suffix.lower()
         if extension not in self.ALLOWED_FILE_EXTENSIONS:
             raise ValueError(
                 "Unsupported file type. Upload Excel workbooks, CSV/TSV extracts, or OpenDocument spreadsheets."
             )
-        if len(data) > self._max_upload_bytes:
-            raise ValueError("File exceeds the maximum allowed size of 10 MB.")
 
-        artifact_id = str(uuid4())
+        artifact_id = str(uuid7())
         sanitized_name = Path(filename).name
-        session_dir = self._storage_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
-        storage_path = session_dir / f"{artifact_id}{extension}"
-        storage_path.write_bytes(data)
+        tmp_path = self._storage_dir / f".{artifact_id}.part"
+
+        hasher = hashlib.sha256()
+        size_bytes = 0
+        oversize = False
+        async with aiofiles.open(tmp_path, "wb") as out:
+            while chunk := await file.read(self.UPLOAD_CHUNK_BYTES):
+                size_bytes += len(chunk)
+                if size_bytes > self._max_upload_bytes:
+                    oversize = True
+                    break
+                hasher.update(chunk)
+                await out.write(chunk)
+        if oversize:
+            tmp_path.unlink(missing_ok=True)
+            raise ValueError("File exceeds the maximum allowed size of 10 MB.")
+
+        now = datetime.now(UTC)
+        digest = hasher.hexdigest()
+        for existing in session.artifacts.values():
+            if existing.source == "file" and existing.sha256 == digest:
+                tmp_path.unlink(missing_ok=True)
+                self._logger.info(
+                    "Duplicate upload for session %s matches artifact %s; reusing stored file",
+                    session_id,
+                    existing.id,
+                )
+                return existing
+
+        # Content-addressed layout: identical uploads across sessions share one
+        # file on disk, so a re-upload is a rename-or-discard instead of a copy.
+        blob_dir = self._storage_dir / digest[:2]
+        blob_dir.mkdir(parents=True, exist_ok=True)
+        storage_path = blob_dir / f"{digest}{extension}"
+        if storage_path.exists():
+            tmp_path.unlink(missing_ok=True)
+        else:
+            tmp_path.replace(storage_path)
 
         artifact = SubmissionArtifact(
             id=artifact_id,
             source="file",
             filename=sanitized_name,
             content_type=content_type,
-            size_bytes=len(data),
-            uploaded_at=datetime.utcnow(),
+            size_bytes=size_bytes,
+            sha256=digest,
+            uploaded_at=now,
             description=(description or "").strip(),
             storage_path=str(storage_path),
         )
         session.artifacts[artifact_id] = artifact
-        session.updated_at = datetime.utcnow()
+        session.updated_at = now
+        await self._store.put(session)
         self._logger.info(
             "Stored workbook artifact %s for session %s (filename=%s, size=%d bytes)",
             artifact_id,
             session_id,
             sanitized_name,
-            len(data),
+            size_bytes,
         )
         return artifact
 
-    def store_link_artifact(
+    async def store_link_artifact(
         self,
         session_id: str,
         *,
         url: str,
         description: str | None = None,
     ) -> SubmissionArtifact:
-        session = self._get_session(session_id)
+        session = await self._get_session(session_id)
         cleaned_url = url.strip()
         if not cleaned_url or not cleaned_url.lower().startswith(("http://", "https://")):
             raise ValueError("Provide a valid shareable link starting with http:// or https://")
-        artifact_id = str(uuid4())
+        now = datetime.now(UTC)
+        artifact_id = str(uuid7())
         artifact = SubmissionArtifact(
             id=artifact_id,
             source="link",
             filename=None,
             content_type=None,
             size_bytes=None,
-            uploaded_at=datetime.utcnow(),
+            uploaded_at=now,
             description=(description or "").strip(),
             url=cleaned_url,
         )
         session.artifacts[artifact_id] = artifact
-        session.updated_at = datetime.utcnow()
+        session.updated_at = now
+        await self._store.put(session)
         self._logger.info("Recorded link artifact %s for session %s", artifact_id, session_id)
         return artifact
 
-    def get_artifact(self, session_id: str, artifact_id: str) -> SubmissionArtifact:
-        session = self._get_session(session_id)
+    async def get_artifact(self, session_id: str, artifact_id: str) -> SubmissionArtifact:
+        session = await self._get_session(session_id)
         artifact = session.artifacts.get(artifact_id)
         if not artifact:
             self._logger.warning(
@@ -279,58 +441,55 @@ class InterviewService:
             raise KeyError(f"Unknown artifact id {artifact_id}")
         return artifact
 
-    def _get_session(self, session_id: str) -> InterviewSession:
-        if session_id not in self._sessions:
+    async def _get_session(self, session_id: str) -> InterviewSession:
+        session = await self._store.get(session_id)
+        if session is None:
             self._logger.warning("Attempt to access unknown session id %s", session_id)
             raise KeyError(f"Unknown session id {session_id}")
-        return self._sessions[session_id]
+        return session
 
     def _record_ai_turn(
         self,
         session: InterviewSession,
         content: Dict[str, any],
+        raw_content: str,
         *,
         candidate_message: Optional[ChatMessage],
+        now: datetime,
     ) -> ChatTurn:
         interviewer_message_text = content.get("interviewer_message", "")
         evaluation_payload = content.get("evaluation") or {}
         next_best_action = content.get("next_best_action")
 
-        interviewer_message = ChatMessage(
+        # Internal payloads are already validated/typed, so skip Pydantic's
+        # field validation with model_construct on this hot path.
+        interviewer_message = ChatMessage.model_construct(
             role="interviewer",
             content=interviewer_message_text,
-            created_at=datetime.utcnow(),
+            created_at=now,
         )
 
         evaluation = None
         if evaluation_payload:
-            evaluation = EvaluationSnapshot(
+            evaluation = EvaluationSnapshot.model_construct(
                 summary=evaluation_payload.get("summary", ""),
                 strengths=list(evaluation_payload.get("strengths", []) or []),
                 gaps=list(evaluation_payload.get("gaps", []) or []),
                 rubric_scores=dict(evaluation_payload.get("rubric_scores", {}) or {}),
                 recommendation=evaluation_payload.get("recommendation", ""),
             )
-            updated_scores = session.record_scores(evaluation.rubric_scores)
-        else:
-            updated_scores = {}
+            session.record_scores(evaluation.rubric_scores)
 
-        turn = ChatTurn(
+        turn = ChatTurn.model_construct(
             candidate_message=candidate_message,
             interviewer_message=interviewer_message,
             evaluation=evaluation,
             next_best_action=next_best_action,
         )
         session.transcript.append(turn)
-        session.messages.append({"role": "assistant", "content": json.dumps(content)})
-        session.updated_at = datetime.utcnow()
-
-        # ensure the running averages include skills with no updates yet by seeding them at 0
-        for skill in SKILL_RUBRIC:
-            session.score_totals.setdefault(skill, 0.0)
-            session.score_counts.setdefault(skill, 0)
-        if updated_scores:
-            session.running_scores()
+        session.transcript_json_chunks.append(to_json(turn))
+        session.messages.append({"role": "assistant", "content": raw_content})
+        session.updated_at = now
 
         return turn
 
@@ -1,18 +1,25 @@
 """LLM client abstractions for Azure OpenAI."""
 from __future__ import annotations
 
-import json
-from typing import Any, Dict, List, Protocol
+import asyncio
+import hashlib
+import logging
+from typing import Any, AsyncIterator, Dict, List, Protocol, Tuple
 
-from openai import AzureOpenAI
+import orjson
+
+LOGGER = logging.getLogger(__name__)
 
 
 class LLMClient(Protocol):
     """Protocol describing LLM capabilities used by the interview service."""
 
-    def chat_completion(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+    async def chat_completion(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
         """Execute a chat completion with the given messages."""
 
+    def chat_completion_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Stream the content deltas of a chat completion."""
+
 
 class AzureOpenAILLM:
     """Wrapper around Azure OpenAI Chat Completions."""
@@ -27,17 +34,47 @@ class AzureOpenAILLM:
         temperature: float = 0.2,
         max_tokens: int = 900,
     ) -> None:
-        self._client = AzureOpenAI(
+        # Deferred imports: the openai/httpx stack is heavy and only needed
+        # once a client is actually constructed, not at module import.
+        import httpx
+        from openai import AsyncAzureOpenAI
+
+        # One shared pool with HTTP/2 + keepalive so repeated completions reuse
+        # a warm TLS connection instead of paying a handshake per call.
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        self._client = AsyncAzureOpenAI(
             api_key=api_key,
             azure_endpoint=endpoint,
             api_version=api_version,
+            http_client=self._http_client,
         )
         self._deployment = deployment
         self._temperature = temperature
         self._max_tokens = max_tokens
 
-    def chat_completion(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
-        response = self._client.chat.completions.create(
+    async def aclose(self) -> None:
+        """Release the pooled HTTP connections."""
+
+        await self._http_client.aclose()
+
+    async def warmup(self) -> None:
+        """Open a TLS connection to Azure ahead of the first completion.
+
+        Best effort: failures only cost the warm start, so they are logged
+        and swallowed.
+        """
+
+        try:
+            await asyncio.wait_for(self._client.models.list(), timeout=5.0)
+        except Exception as exc:  # pragma: no cover - best effort
+            LOGGER.debug("Azure OpenAI warmup skipped: %s", exc)
+
+    async def chat_completion(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        response = await self._client.chat.completions.create(
             model=self._deployment,
             messages=messages,
             temperature=self._temperature,
@@ -47,17 +84,61 @@ class AzureOpenAILLM:
         payload = response.model_dump()
         return payload
 
+    async def chat_completion_stream(self, messages: List[Dict[str, str]]) -> AsyncIterator[str]:
+        """Yield content deltas as Azure streams the completion."""
+
+        stream = await self._client.chat.completions.create(
+            model=self._deployment,
+            messages=messages,
+            temperature=self._temperature,
+            max_tokens=self._max_tokens,
+            response_format={"type": "json_object"},
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+
     @staticmethod
-    def extract_content(payload: Dict[str, Any]) -> Dict[str, Any]:
-        """Parse the JSON content string returned by Azure."""
+    def extract_content(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        """Parse the JSON content string returned by Azure.
+
+        Returns both the parsed object and the raw content string so callers
+        can reuse the original serialization without a re-dump.
+        """
 
         try:
             choice = payload["choices"][0]
             message = choice["message"]
             content = message.get("content", "{}")
-            return json.loads(content)
-        except (KeyError, json.JSONDecodeError, IndexError) as exc:  # pragma: no cover - defensive
+            return orjson.loads(content), content
+        except (KeyError, orjson.JSONDecodeError, IndexError) as exc:  # pragma: no cover - defensive
             raise ValueError("Unable to parse LLM response payload") from exc
 
 
-__all__ = ["LLMClient", "AzureOpenAILLM"]
+class SingleFlightLLM:
+    """Coalesces concurrent identical completions into one upstream call.
+
+    Retries and double-submits that carry the exact same message list share a
+    single in-flight Azure request instead of paying for duplicates.
+    """
+
+    def __init__(self, inner: LLMClient) -> None:
+        self._inner = inner
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+
+    async def chat_completion(self, messages: List[Dict[str, str]]) -> Dict[str, Any]:
+        key = hashlib.blake2b(orjson.dumps(messages), digest_size=16).digest()
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._inner.chat_completion(messages))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled does not fail the shared call.
+        return await asyncio.shield(task)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+
+__all__ = ["LLMClient", "AzureOpenAILLM", "SingleFlightLLM"]
@@ -0,0 +1,91 @@
+"""Pluggable persistence backends for interview sessions.
+
+The default in-memory store keeps the original single-process behaviour.
+The Redis store serializes sessions as JSON with a TTL so multiple
+Uvicorn workers can share state and survive restarts.
+"""
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Protocol
+
+import orjson
+
+if TYPE_CHECKING:  # pragma: no cover - import cycle guard
+    from .interview_service import InterviewSession
+
+LOGGER = logging.getLogger(__name__)
+
+
+class SessionStore(Protocol):
+    """Protocol describing session persistence used by the interview service."""
+
+    async def get(self, session_id: str) -> Optional["InterviewSession"]:
+        """Return the session for the given id, or None if unknown."""
+
+    async def put(self, session: "InterviewSession") -> None:
+        """Persist the session, replacing any previous state."""
+
+    async def delete(self, session_id: str) -> None:
+        """Remove the session if it exists."""
+
+
+class InMemorySessionStore:
+    """Process-local store matching the original dict-based behaviour."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, "InterviewSession"] = {}
+
+    async def get(self, session_id: str) -> Optional["InterviewSession"]:
+        return self._sessions.get(session_id)
+
+    async def put(self, session: "InterviewSession") -> None:
+        self._sessions[session.session_id] = session
+
+    async def delete(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+class RedisSessionStore:
+    """Redis-backed store so sessions survive restarts and scale across workers."""
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        ttl_seconds: int = 2 * 60 * 60,
+        key_prefix: str = "interview:session:",
+    ) -> None:
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise RuntimeError(
+                "RedisSessionStore requires the 'redis' package. Install it with: pip install redis"
+            ) from exc
+        self._redis = aioredis.from_url(url)
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+
+    def _key(self, session_id: str) -> str:
+        return f"{self._key_prefix}{session_id}"
+
+    async def get(self, session_id: str) -> Optional["InterviewSession"]:
+        raw = await self._redis.get(self._key(session_id))
+        if raw is None:
+            return None
+        from .interview_service import InterviewSession
+
+        return InterviewSession.from_payload(orjson.loads(raw))
+
+    async def put(self, session: "InterviewSession") -> None:
+        await self._redis.set(
+            self._key(session.session_id),
+            orjson.dumps(session.to_payload()),
+            ex=self._ttl_seconds,
+        )
+
+    async def delete(self, session_id: str) -> None:
+        await self._redis.delete(self._key(session_id))
+
+
+__all__ = ["SessionStore", "InMemorySessionStore", "RedisSessionStore"]
@@ -1,8 +1,9 @@
-from backend.app.schemas import CandidateProfile, FocusArea, WorkbookPlatform
+from backend.app.schemas import CandidateProfile, FocusArea, SessionCreateRequest, WorkbookPlatform
 from backend.app.utils.prompt_templates import (
     SKILL_RUBRIC,
     build_interview_system_prompt,
     build_session_bootstrap_prompt,
+    build_session_bootstrap_prompts,
     build_summary_prompt,
 )
 
@@ -59,3 +60,25 @@ def test_bootstrap_prompt_mentions_google_sheets_guidance():
     )
     assert "Google Sheets" in prompt
     assert "collaborative" in prompt
+
+
+def test_batch_bootstrap_prompts_match_single_builder():
+    candidate = CandidateProfile(
+        name="Riley", current_role="Analyst", years_experience=3, target_role="Lead", focus_areas=[]
+    )
+    requests = [
+        SessionCreateRequest(candidate=candidate, scenario="fpanda"),
+        SessionCreateRequest(
+            candidate=candidate, scenario="retail", workbook_platform=WorkbookPlatform.GOOGLE_SHEETS
+        ),
+    ]
+    prompts = build_session_bootstrap_prompts(requests)
+    assert prompts == [
+        build_session_bootstrap_prompt(
+            request.candidate,
+            request.scenario,
+            request.candidate.focus_areas,
+            workbook_platform=request.workbook_platform,
+        )
+        for request in requests
+    ]